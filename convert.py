@@ -7,40 +7,208 @@ to RetroArch overlay .cfg files with PNG assets.
 """
 
 import argparse
+import codecs
+import contextlib
+import functools
+import hashlib
+import io
 import json
+import mmap
+import operator
 import os
+import shutil
 import sys
+import warnings
 import zipfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# The PDF renderer and PIL are imported by _load_pdf_backend() on first use;
+# they dominate startup and aren't needed for --help or PNG-only skins
+fitz = None
+convert_from_bytes = None
+Image = None
+_pdf_backend_loaded = False
+
 try:
-    from pdf2image import convert_from_bytes
+    import orjson
+    _loads = orjson.loads
 except ImportError:
-    convert_from_bytes = None
-    print("Warning: pdf2image not installed. PDF conversion will fail.", file=sys.stderr)
-    print("Install with: pip install pdf2image", file=sys.stderr)
-    print("Also requires poppler: brew install poppler", file=sys.stderr)
+    _loads = json.loads
 
 try:
-    from PIL import Image
+    import ijson
 except ImportError:
-    Image = None
+    ijson = None
+
+from input_mapping import GAME_TYPE_NAMES, IDENTITY_INPUTS, INPUT_DROP, INPUT_REMAP
+
+
+class _MappedFile(mmap.mmap):
+    """mmap that zipfile accepts as a file object (mmap lacks seekable() before 3.13)."""
+
+    def seekable(self):
+        return True
+
+
+class _LazyZipFiles:
+    """Read-on-demand view of the asset files in an open deltaskin archive."""
+
+    def __init__(self, zf):
+        self._zf = zf
+
+    def __contains__(self, name):
+        return name in self._zf.NameToInfo
+
+    def __getitem__(self, name):
+        return self._zf.read(name)
+
+    def open(self, name):
+        return self._zf.open(name)
+
+    def size(self, name):
+        return self._zf.getinfo(name).file_size
 
-from input_mapping import DELTA_TO_RETROARCH, GAME_TYPE_NAMES
+    def copy_to(self, name, dest):
+        """Stream a member to dest without holding it all in memory."""
+        with self._zf.open(name) as src, open(dest, 'wb') as dst:
+            shutil.copyfileobj(src, dst, length=1 << 20)
 
 
-def parse_deltaskin(deltaskin_path):
-    """Extract and parse a deltaskin ZIP archive."""
-    with zipfile.ZipFile(deltaskin_path, 'r') as zf:
-        info_json = zf.read('info.json')
-        info = json.loads(info_json)
+class _LazyDirFiles:
+    """Read-on-demand view of the asset files in an expanded deltaskin directory."""
+
+    def __init__(self, root):
+        self._root = Path(root).resolve()
+
+    def _path(self, name):
+        # Names come from info.json, so keep absolute paths, '..' and symlinks
+        # from reaching files outside the skin
+        path = (self._root / name).resolve()
+        if self._root not in path.parents:
+            raise KeyError(name)
+        return path
+
+    def __contains__(self, name):
+        try:
+            return self._path(name).is_file()
+        except KeyError:
+            return False
+
+    def __getitem__(self, name):
+        try:
+            return self._path(name).read_bytes()
+        except FileNotFoundError:
+            raise KeyError(name)
+
+    def open(self, name):
+        return open(self._path(name), 'rb')
+
+    def size(self, name):
+        return self._path(name).stat().st_size
+
+    def copy_to(self, name, dest):
+        """Hard-link a file to dest, copying if linking isn't possible."""
+        src = self._path(name)
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(dest)
+        try:
+            os.link(src, dest)
+        except OSError:
+            # Cross-device or filesystem without hard links
+            shutil.copy2(src, dest)
+
+
+# Below this size a full parse is faster than streaming, and memory is no concern
+STREAM_INFO_MIN_BYTES = 1 << 20
+
+_JSON_SCALAR_EVENTS = frozenset(('string', 'number', 'boolean', 'null'))
+
+
+def _stream_info_subset(f, devices):
+    """Stream info.json, building only the top-level scalars and requested devices."""
+    wanted = {f'representations.{device}': device for device in devices}
+    info = {}
+    representations = {}
+    builder = None
+    building = None
+
+    for prefix, event, value in ijson.parse(f, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == building and event in ('end_map', 'end_array'):
+                representations[wanted[building]] = builder.value
+                builder = None
+        elif prefix in wanted and event in ('start_map', 'start_array'):
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            building = prefix
+        elif prefix and '.' not in prefix and event in _JSON_SCALAR_EVENTS:
+            info[prefix] = value
+
+    info['representations'] = representations
+    return info
+
+
+def _load_info(f, size, devices):
+    """Parse an open info.json, streaming it if it is large and only some devices are needed."""
+    # json.loads accepts a UTF-8 BOM, but orjson and ijson reject it
+    if devices is not None and ijson is not None and size >= STREAM_INFO_MIN_BYTES:
+        if f.peek(len(codecs.BOM_UTF8)).startswith(codecs.BOM_UTF8):
+            f.read(len(codecs.BOM_UTF8))
+        return _stream_info_subset(f, devices)
+    data = f.read()
+    if data.startswith(codecs.BOM_UTF8):
+        data = data[len(codecs.BOM_UTF8):]
+    return _loads(data)
+
+
+@contextlib.contextmanager
+def open_skin_files(deltaskin_path):
+    """Open a deltaskin ZIP archive or directory for on-demand asset reads.
+
+    Yields the files accessor, which is only valid while the context is open.
+    """
+    if os.path.isdir(deltaskin_path):
+        yield _LazyDirFiles(deltaskin_path)
+        return
+
+    # Map the archive so member reads are copies out of the page cache rather
+    # than a seek + read syscall pair per chunk
+    with open(deltaskin_path, 'rb') as f:
+        try:
+            mm = _MappedFile(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file; let zipfile report it as a bad archive
+            mm = None
+
+    try:
+        with zipfile.ZipFile(mm if mm is not None else deltaskin_path, 'r') as zf:
+            yield _LazyZipFiles(zf)
+    finally:
+        if mm is not None:
+            mm.close()
 
-        files = {}
-        for name in zf.namelist():
-            if name != 'info.json':
-                files[name] = zf.read(name)
 
-    return info, files
+@contextlib.contextmanager
+def parse_deltaskin(deltaskin_path, devices=None):
+    """Open a deltaskin ZIP archive or directory and parse its info.json.
+
+    Yields (info, files); assets in files are only read when indexed, and
+    only while the context is open. If devices is given, representations for
+    other devices may be left out of info.
+    """
+    with open_skin_files(deltaskin_path) as files:
+        with files.open('info.json') as f:
+            info = _load_info(f, files.size('info.json'), devices)
+        yield info, files
+
+
+def read_skin_info(deltaskin_path, devices=None):
+    """Parse just the info.json of a deltaskin."""
+    with parse_deltaskin(deltaskin_path, devices) as (info, _):
+        return info
 
 
 def get_display_type_preference(device_data):
@@ -53,16 +221,184 @@ def get_display_type_preference(device_data):
     return None
 
 
-def convert_pdf_to_png(pdf_bytes, mapping_size, scale=3):
-    """Convert PDF bytes to PNG image at mappingSize dimensions."""
+def available_orientations(type_data):
+    """Get the orientations with data, portrait first."""
+    orientations = []
+    if type_data.get('portrait'):
+        orientations.append('portrait')
+    if type_data.get('landscape'):
+        orientations.append('landscape')
+    return orientations
+
+
+def _load_pdf_backend():
+    """Import PIL and a PDF renderer (PyMuPDF, else pdf2image) once, on first use."""
+    global fitz, convert_from_bytes, Image, _pdf_backend_loaded
+    if _pdf_backend_loaded:
+        return
+    _pdf_backend_loaded = True
+
+    try:
+        from PIL import Image
+    except ImportError:
+        pass
+
+    try:
+        import pymupdf as fitz
+    except ImportError:
+        try:
+            import fitz
+        except ImportError:
+            pass
+
+    if fitz is None:
+        try:
+            from pdf2image import convert_from_bytes
+        except ImportError:
+            warnings.warn(
+                "neither PyMuPDF nor pdf2image installed, PDF conversion will fail. "
+                "Install with: pip install PyMuPDF",
+                stacklevel=3,
+            )
+
+
+RENDER_TILE_SIZE = 512
+
+
+def render_page_tiled(display_list, target_width, target_height, tile_size=RENDER_TILE_SIZE):
+    """Render a PyMuPDF display list to an RGBA image, one tile at a time."""
+    # Only one tile-sized pixmap is alive at once, so large 3x iPad renders
+    # never hold a second full-size buffer alongside the output image
+    zoom_x = target_width / display_list.rect.width
+    zoom_y = target_height / display_list.rect.height
+    matrix = fitz.Matrix(zoom_x, zoom_y)
+
+    tiles = [
+        (x0, y0, min(tile_size, target_width - x0), min(tile_size, target_height - y0))
+        for y0 in range(0, target_height, tile_size)
+        for x0 in range(0, target_width, tile_size)
+    ]
+
+    out = Image.new('RGBA', (target_width, target_height))
+    for x0, y0, tw, th in tiles:
+        # Clip is in page space; the pixmap comes back positioned at (x0, y0)
+        clip = fitz.Rect(x0 / zoom_x, y0 / zoom_y, (x0 + tw) / zoom_x, (y0 + th) / zoom_y)
+        pix = display_list.get_pixmap(matrix=matrix, alpha=True, clip=clip)
+        # MuPDF alpha pixmaps are premultiplied ('RGBa'); un-premultiply per
+        # tile so the output matches poppler's straight alpha
+        tile = Image.frombytes('RGBa', (pix.width, pix.height), pix.samples).convert('RGBA')
+        out.paste(tile, (pix.x, pix.y))
+        pix = None  # release the C buffer before rendering the next tile
+
+    return out
+
+
+# Bump when the renderer output changes so stale cached renders are ignored
+# (2: MuPDF tiles un-premultiplied)
+RENDER_CACHE_VERSION = 2
+
+
+def get_cache_dir():
+    """Get the on-disk cache directory for rendered PDFs."""
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'skin2overlay'
+
+
+def _raster_cache_path(digest, size):
+    # Renders from different backends differ slightly, so never share entries
+    backend = 'mupdf' if fitz is not None else 'poppler'
+    return get_cache_dir() / f'{digest}_{size[0]}x{size[1]}_{backend}_v{RENDER_CACHE_VERSION}.png'
+
+
+def _load_cached_raster(digest, size):
+    """Look up a previous render on disk. Returns None on a miss."""
+    cache_path = _raster_cache_path(digest, size)
+    if not cache_path.exists():
+        return None
+    try:
+        img = Image.open(cache_path)
+        img.load()
+    except Exception:
+        # Truncated or corrupt entry; drop it and render again
+        with contextlib.suppress(OSError):
+            cache_path.unlink()
+        return None
+    return img
+
+
+def _store_cached_raster(digest, size, img):
+    """Save a fresh render to the disk cache."""
+    cache_path = _raster_cache_path(digest, size)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write under a temporary name so readers never see a partial PNG
+        tmp_path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.tmp')
+        img.save(str(tmp_path), 'PNG')
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"      Warning: could not write render cache: {e}", file=sys.stderr)
+
+
+def rasterize_pdf(pdf_bytes, sizes):
+    """Render the first page of a PDF at each (width, height) in sizes."""
+    if fitz is not None:
+        # Render in-process with MuPDF; no poppler subprocess or PPM piping
+        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+        try:
+            # Interpret the page once and replay it for every size and tile
+            display_list = doc.load_page(0).get_displaylist()
+            return [render_page_tiled(display_list, w, h) for w, h in sizes]
+        finally:
+            doc.close()
+
+    # Fallback: poppler via pdf2image
     if convert_from_bytes is None:
-        raise RuntimeError("pdf2image not installed")
+        raise RuntimeError("PyMuPDF or pdf2image required for PDF conversion")
+
+    images = []
+    for size in sizes:
+        pages = convert_from_bytes(pdf_bytes, size=size, transparent=True, use_pdftocairo=True)
+        images.append(pages[0] if pages else None)
+    return images
+
+
+def convert_pdf_to_pngs(pdf_bytes, mapping_sizes, scale=3):
+    """Convert PDF bytes to one PNG image per mappingSize, parsing the PDF at most once."""
+    _load_pdf_backend()
+    sizes = [(int(ms['width'] * scale), int(ms['height'] * scale)) for ms in mapping_sizes]
+    digest = hashlib.sha256(pdf_bytes).hexdigest()
+
+    images = {}
+    missing = []
+    for size in dict.fromkeys(sizes):
+        img = _load_cached_raster(digest, size)
+        if img is None:
+            missing.append(size)
+        else:
+            images[size] = img
+
+    if missing:
+        for size, img in zip(missing, rasterize_pdf(pdf_bytes, missing)):
+            if img is not None:
+                _store_cached_raster(digest, size, img)
+                images[size] = img
+
+    # Callers punch screen holes into the results, so a size requested twice
+    # gets its own copy the second time
+    results = []
+    handed_out = set()
+    for size in sizes:
+        img = images.get(size)
+        if img is not None and size in handed_out:
+            img = img.copy()
+        handed_out.add(size)
+        results.append(img)
+    return results
 
-    target_width = int(mapping_size['width'] * scale)
-    target_height = int(mapping_size['height'] * scale)
 
-    images = convert_from_bytes(pdf_bytes, size=(target_width, target_height), transparent=True, use_pdftocairo=True)
-    return images[0] if images else None
+def convert_pdf_to_png(pdf_bytes, mapping_size, scale=3):
+    """Convert PDF bytes to PNG image at mappingSize dimensions."""
+    return convert_pdf_to_pngs(pdf_bytes, [mapping_size], scale)[0]
 
 
 def make_screen_transparent(img, screen_frames, mapping_size, scale=3):
@@ -125,78 +461,100 @@ def compute_bounding_box(frames):
     }
 
 
-def normalize_frame(frame, mapping_size):
-    """Convert pixel coordinates to normalized 0-1 coordinates (center + half-size)."""
-    x = (frame['x'] + frame['width'] / 2) / mapping_size['width']
-    y = (frame['y'] + frame['height'] / 2) / mapping_size['height']
-    w = (frame['width'] / 2) / mapping_size['width']
-    h = (frame['height'] / 2) / mapping_size['height']
-    return x, y, w, h
+_DPAD_KEYS = frozenset(('up', 'down', 'left', 'right'))
+_ANALOG_VALUES = frozenset(('analogStickUp', 'analogStickDown', 'analogStickLeft', 'analogStickRight'))
 
 
-def is_dpad(inputs):
-    """Check if inputs represent a d-pad."""
-    if not isinstance(inputs, dict):
-        return False
-    return all(k in inputs for k in ['up', 'down', 'left', 'right'])
+def classify_inputs(inputs):
+    """Classify item inputs as 'button', 'analog', 'dpad' or 'none'."""
+    if isinstance(inputs, list):
+        return 'button' if inputs else 'none'
+    if isinstance(inputs, dict):
+        # Analog sticks also use up/down/left/right keys, so check them first
+        # Values may be non-strings (and unhashable) in hand-edited skins
+        if any(isinstance(v, str) and v in _ANALOG_VALUES for v in inputs.values()):
+            return 'analog'
+        if _DPAD_KEYS.issubset(inputs):
+            return 'dpad'
+    return 'none'
 
 
-def is_analog_stick(inputs):
-    """Check if inputs represent an analog stick."""
-    if not isinstance(inputs, dict):
-        return False
-    # Check for analog stick - values contain 'analogStick' prefix
-    analog_values = ['analogStickUp', 'analogStickDown', 'analogStickLeft', 'analogStickRight']
-    return any(v in analog_values for v in inputs.values() if isinstance(v, str))
+# One %-format over a tuple is measurably cheaper than an f-string with four
+# separate float format specs, and produces identical text
+_DESC_FMT = '%s = "%s,%.6f,%.6f,%s,%.6f,%.6f"\n'
 
 
-def convert_item_to_descriptor(item, mapping_size, index, overlay_index=0):
-    """Convert a Delta item to RetroArch overlay descriptor(s)."""
-    frame = item.get('frame')
-    inputs = item.get('inputs')
+# Single C-level lookups for the keys read from every item
+_get_frame_inputs = operator.itemgetter('frame', 'inputs')
+_get_xywh = operator.itemgetter('x', 'y', 'width', 'height')
 
-    if not frame or not inputs:
-        return []
 
-    x, y, w, h = normalize_frame(frame, mapping_size)
+def convert_item_to_descriptor(item, map_w, map_h, index, overlay_index=0):
+    """Convert a Delta item to RetroArch overlay descriptor(s).
+
+    map_w/map_h are the mappingSize width/height. Returns newline-terminated
+    config text, or '' if the item has nothing to emit.
+    """
+    try:
+        frame, inputs = _get_frame_inputs(item)
+    except KeyError:
+        return ''
+
+    if not frame or not inputs:
+        return ''
+
+    # Normalized center + half-size. Divide rather than multiply by a
+    # reciprocal: the results must round exactly like the web converter's
+    fx, fy, fw, fh = _get_xywh(frame)
+    half_w = fw * 0.5
+    half_h = fh * 0.5
+    x = (fx + half_w) / map_w
+    y = (fy + half_h) / map_h
+    w = half_w / map_w
+    h = half_h / map_h
     prefix = f'overlay{overlay_index}_desc{index}'
-    lines = []
+    desc = ''
 
-    if isinstance(inputs, list) and len(inputs) > 0:
+    kind = classify_inputs(inputs)
+    if kind == 'button':
         # Single button or list of buttons
-        ra_input = DELTA_TO_RETROARCH.get(inputs[0], inputs[0])
-        if ra_input:
-            lines.append(f'{prefix} = "{ra_input},{x:.6f},{y:.6f},radial,{w:.6f},{h:.6f}"')
-
-    elif isinstance(inputs, dict):
-        if is_analog_stick(inputs):
-            # Analog stick
-            lines.append(f'{prefix} = "analog_left,{x:.6f},{y:.6f},radial,{w:.6f},{h:.6f}"')
-        elif is_dpad(inputs):
-            # D-pad
-            lines.append(f'{prefix} = "dpad_area,{x:.6f},{y:.6f},rect,{w:.6f},{h:.6f}"')
-
-    # Handle extended edges if present
-    extended = item.get('extendedEdges', {})
+        delta_input = inputs[0]
+        if delta_input not in INPUT_DROP:
+            ra_input = delta_input if delta_input in IDENTITY_INPUTS else INPUT_REMAP.get(delta_input, delta_input)
+            if ra_input:
+                desc = _DESC_FMT % (prefix, ra_input, x, y, 'radial', w, h)
+    elif kind == 'analog':
+        desc = _DESC_FMT % (prefix, 'analog_left', x, y, 'radial', w, h)
+    elif kind == 'dpad':
+        desc = _DESC_FMT % (prefix, 'dpad_area', x, y, 'rect', w, h)
+
+    # Handle extended edges if present (reach is relative to the half-size)
+    extended = item.get('extendedEdges')
     if extended:
-        if extended.get('top'):
-            lines.append(f'{prefix}_reach_up = {1 + extended["top"] / (frame["height"] / 2):.2f}')
-        if extended.get('bottom'):
-            lines.append(f'{prefix}_reach_down = {1 + extended["bottom"] / (frame["height"] / 2):.2f}')
-        if extended.get('left'):
-            lines.append(f'{prefix}_reach_left = {1 + extended["left"] / (frame["width"] / 2):.2f}')
-        if extended.get('right'):
-            lines.append(f'{prefix}_reach_right = {1 + extended["right"] / (frame["width"] / 2):.2f}')
-
-    return lines
+        ext_top = extended.get('top')
+        ext_bottom = extended.get('bottom')
+        ext_left = extended.get('left')
+        ext_right = extended.get('right')
+        # Each division only happens for an edge that is set, so a zero-size
+        # axis is harmless when that axis has no extended edges
+        if ext_top:
+            desc += '%s_reach_up = %.2f\n' % (prefix, 1 + ext_top / half_h)
+        if ext_bottom:
+            desc += '%s_reach_down = %.2f\n' % (prefix, 1 + ext_bottom / half_h)
+        if ext_left:
+            desc += '%s_reach_left = %.2f\n' % (prefix, 1 + ext_left / half_w)
+        if ext_right:
+            desc += '%s_reach_right = %.2f\n' % (prefix, 1 + ext_right / half_w)
+
+    return desc
 
 
 def generate_overlay_config(skin_name, device, orientations, portrait_data, landscape_data):
     """Generate overlay config for a device with portrait/landscape rotation support."""
-    lines = []
+    buf = io.StringIO()
+    write = buf.write
     num_overlays = len(orientations)
-    lines.append(f'overlays = {num_overlays}')
-    lines.append('')
+    write(f'overlays = {num_overlays}\n')
 
     overlay_index = 0
 
@@ -223,8 +581,7 @@ def generate_overlay_config(skin_name, device, orientations, portrait_data, land
         # Compute viewport from screen frames
         viewport = None
         if screen_frames:
-            frames = [s.get('outputFrame', s.get('inputFrame', {})) for s in screen_frames if s]
-            frames = [f for f in frames if f]
+            frames = tuple(f for s in screen_frames if s and (f := s.get('outputFrame', s.get('inputFrame'))))
             if frames:
                 viewport = compute_bounding_box(frames)
             else:
@@ -232,10 +589,11 @@ def generate_overlay_config(skin_name, device, orientations, portrait_data, land
         else:
             viewport = data.get('gameScreenFrame')
 
-        # Overlay header
-        lines.append(f'overlay{overlay_index}_name = "{orientation}"')
-        lines.append(f'overlay{overlay_index}_overlay = "{img_name}"')
-        lines.append(f'overlay{overlay_index}_normalized = true')
+        # Overlay header, separated from the previous block by a blank line
+        oi = overlay_index
+        write(f'\noverlay{oi}_name = "{orientation}"\n'
+              f'overlay{oi}_overlay = "{img_name}"\n'
+              f'overlay{oi}_normalized = true\n')
 
         # Typical edge-to-edge iPhone aspect ratio (19.5:9)
         screen_aspect = 2.167
@@ -247,38 +605,39 @@ def generate_overlay_config(skin_name, device, orientations, portrait_data, land
             controller_height_ratio = controller_aspect / screen_aspect
             controller_y = 1.0 - controller_height_ratio
 
-            # full_screen = true so overlay is positioned on physical screen
-            lines.append(f'overlay{overlay_index}_full_screen = true')
-
             # Set aspect_ratio to match display to prevent auto_scale from shrinking overlay
             # iOS defaults auto_scale=true and "portrait" overlays get 0.5625 (9:16)
             # but actual display is ~0.46, causing y_scale=0.88. Match display to get 1.0.
             display_aspect_ratio = 1.0 / screen_aspect
-            lines.append(f'overlay{overlay_index}_aspect_ratio = {display_aspect_ratio:.6f}')
 
-            # Position overlay at bottom of screen
-            lines.append(f'overlay{overlay_index}_rect = "0.0,{controller_y:.6f},1.0,{controller_height_ratio:.6f}"')
-
-            # Viewport for game = top portion of screen
-            lines.append(f'overlay{overlay_index}_viewport = "0.0,0.0,1.0,{controller_y:.6f}"')
+            # full_screen = true so overlay is positioned on physical screen,
+            # overlay_rect positions it at the bottom, and the game viewport
+            # takes the top portion of the screen
+            write(f'overlay{oi}_full_screen = true\n'
+                  f'overlay{oi}_aspect_ratio = {display_aspect_ratio:.6f}\n'
+                  f'overlay{oi}_rect = "0.0,{controller_y:.6f},1.0,{controller_height_ratio:.6f}"\n'
+                  f'overlay{oi}_viewport = "0.0,0.0,1.0,{controller_y:.6f}"\n')
         else:
             # Landscape mode: full screen, use viewport from gameScreenFrame
-            lines.append(f'overlay{overlay_index}_full_screen = true')
             # Set aspect_ratio to match display to prevent auto_scale from shrinking width
-            lines.append(f'overlay{overlay_index}_aspect_ratio = {screen_aspect:.6f}')
+            write(f'overlay{oi}_full_screen = true\n'
+                  f'overlay{oi}_aspect_ratio = {screen_aspect:.6f}\n')
             if viewport:
                 vp_x = viewport['x'] / mapping_size['width']
                 vp_y = viewport['y'] / mapping_size['height']
                 vp_w = viewport['width'] / mapping_size['width']
                 vp_h = viewport['height'] / mapping_size['height']
-                lines.append(f'overlay{overlay_index}_viewport = "{vp_x:.6f},{vp_y:.6f},{vp_w:.6f},{vp_h:.6f}"')
+                write('overlay%d_viewport = "%.6f,%.6f,%.6f,%.6f"\n' % (oi, vp_x, vp_y, vp_w, vp_h))
 
-        lines.append('')
+        # The rotation button (added below) takes one extra descriptor slot
+        num_descs = len(items) + 1 if num_overlays > 1 else len(items)
+        write(f'\noverlay{oi}_descs = {num_descs}\n\n')
 
         # Convert items to descriptors
-        desc_lines = []
+        map_w = mapping_size['width']
+        map_h = mapping_size['height']
         for i, item in enumerate(items):
-            desc_lines.extend(convert_item_to_descriptor(item, mapping_size, i, overlay_index))
+            write(convert_item_to_descriptor(item, map_w, map_h, i, oi))
 
         # Add invisible rotation button
         other_orientation = 'landscape' if orientation == 'portrait' else 'portrait'
@@ -286,29 +645,96 @@ def generate_overlay_config(skin_name, device, orientations, portrait_data, land
             rotate_idx = len(items)
             # Place at top center
             if orientation == 'portrait':
-                desc_lines.append(f'overlay{overlay_index}_desc{rotate_idx} = "overlay_next,0.5,0.02,radial,0.04,0.02"')
+                write(f'overlay{oi}_desc{rotate_idx} = "overlay_next,0.5,0.02,radial,0.04,0.02"\n')
             else:
-                desc_lines.append(f'overlay{overlay_index}_desc{rotate_idx} = "overlay_next,0.5,0.04,radial,0.02,0.04"')
-            desc_lines.append(f'overlay{overlay_index}_desc{rotate_idx}_next_target = "{other_orientation}"')
-            num_descs = len(items) + 1
-        else:
-            num_descs = len(items)
-
-        lines.append(f'overlay{overlay_index}_descs = {num_descs}')
-        lines.append('')
-        lines.extend(desc_lines)
-        lines.append('')
+                write(f'overlay{oi}_desc{rotate_idx} = "overlay_next,0.5,0.04,radial,0.02,0.04"\n')
+            write(f'overlay{oi}_desc{rotate_idx}_next_target = "{other_orientation}"\n')
 
         overlay_index += 1
 
-    return '\n'.join(lines)
+    return buf.getvalue()
+
+
+def _process_one_device(device, deltaskin_path, display_type, type_data, orientations,
+                        skin_name, device_output_dir, cfg_name, scale):
+    """Render the images and write the config for one device.
+
+    Runs in a worker process, so it re-opens the skin's assets itself instead
+    of being handed their bytes, and returns its log lines for the parent to print.
+    """
+    log = [f"  Device: {device} ({display_type})",
+           f"    Orientations: {', '.join(orientations)}"]
+
+    portrait_data = type_data.get('portrait')
+    landscape_data = type_data.get('landscape')
+
+    # Group orientations by asset so a PDF shared between them is only parsed once
+    by_asset = defaultdict(list)
+    for orientation in orientations:
+        data = portrait_data if orientation == 'portrait' else landscape_data
+        if not data:
+            continue
+
+        assets = data.get('assets', {})
+        asset_name = assets.get('resizable') or assets.get('small') or assets.get('medium') or assets.get('large')
+        if asset_name:
+            by_asset[asset_name].append((orientation, data))
+
+    with open_skin_files(deltaskin_path) as files:
+        # Convert and save images
+        for asset_name, targets in by_asset.items():
+            if asset_name not in files:
+                continue
+
+            if asset_name.endswith('.pdf'):
+                for orientation, _ in targets:
+                    log.append(f"    Converting {orientation} PDF to PNG...")
+                try:
+                    images = convert_pdf_to_pngs(
+                        files[asset_name], [data['mappingSize'] for _, data in targets], scale
+                    )
+                    for (orientation, data), img in zip(targets, images):
+                        if not img:
+                            continue
+
+                        # Get screen frames for transparency
+                        screen_frames = data.get('screens', [])
+                        if not screen_frames:
+                            gsf = data.get('gameScreenFrame')
+                            if gsf:
+                                screen_frames = [gsf]
+
+                        # Make screen area(s) transparent
+                        if screen_frames:
+                            img = make_screen_transparent(img, screen_frames, data['mappingSize'], scale)
+                        img_path = device_output_dir / f'{orientation}.png'
+                        img.save(str(img_path), 'PNG')
+                        log.append(f"      Saved: {img_path}")
+                except Exception as e:
+                    log.append(f"      Error converting PDF: {e}")
+            elif asset_name.endswith('.png'):
+                # Copy PNG directly
+                for orientation, _ in targets:
+                    img_path = device_output_dir / f'{orientation}.png'
+                    files.copy_to(asset_name, img_path)
+                    log.append(f"      Copied: {img_path}")
+
+    # Generate config
+    config = generate_overlay_config(
+        skin_name, device, orientations, portrait_data, landscape_data
+    )
+    config_path = device_output_dir / cfg_name
+    config_path.write_bytes(config.encode('utf-8'))
+    log.append(f"    Config: {config_path}")
+
+    return log
 
 
 def convert_deltaskin(deltaskin_path, output_dir, devices=None, scale=3):
     """Convert a deltaskin file to RetroArch overlay(s)."""
     print(f"Converting: {deltaskin_path}")
 
-    info, files = parse_deltaskin(deltaskin_path)
+    info = read_skin_info(deltaskin_path, devices)
 
     skin_name = info.get('name', 'Unknown')
     game_type = info.get('gameTypeIdentifier', '')
@@ -325,31 +751,26 @@ def convert_deltaskin(deltaskin_path, output_dir, devices=None, scale=3):
     if devices is None:
         devices = list(representations.keys())
 
+    # Skip messages and device jobs, in device order
+    pending = []
     for device in devices:
         if device not in representations:
-            print(f"  Skipping {device}: not found in skin")
+            pending.append(f"  Skipping {device}: not found in skin")
             continue
 
         device_data = representations[device]
         display_type = get_display_type_preference(device_data)
         if not display_type:
-            print(f"  Skipping {device}: no display types found")
+            pending.append(f"  Skipping {device}: no display types found")
             continue
 
         type_data = device_data[display_type]
 
         # Get available orientations
-        portrait_data = type_data.get('portrait')
-        landscape_data = type_data.get('landscape')
-
-        orientations = []
-        if portrait_data:
-            orientations.append('portrait')
-        if landscape_data:
-            orientations.append('landscape')
+        orientations = available_orientations(type_data)
 
         if not orientations:
-            print(f"  Skipping {device}: no orientations found")
+            pending.append(f"  Skipping {device}: no orientations found")
             continue
 
         # Create output directory
@@ -360,55 +781,38 @@ def convert_deltaskin(deltaskin_path, output_dir, devices=None, scale=3):
         device_output_dir = Path(output_dir) / dir_name
         device_output_dir.mkdir(parents=True, exist_ok=True)
 
-        print(f"  Device: {device} ({display_type})")
-        print(f"    Orientations: {', '.join(orientations)}")
-
-        # Convert and save images
-        for orientation in orientations:
-            data = portrait_data if orientation == 'portrait' else landscape_data
-            if not data:
+        pending.append(dict(
+            device=device, display_type=display_type, type_data=type_data,
+            orientations=orientations, device_output_dir=device_output_dir,
+            cfg_name=f"{dir_name}.cfg",
+        ))
+
+    jobs = [entry for entry in pending if isinstance(entry, dict)]
+    common = dict(deltaskin_path=deltaskin_path, skin_name=skin_name, scale=scale)
+
+    with contextlib.ExitStack() as stack:
+        # Devices are independent and PDF rendering is CPU-bound, so fan out
+        # across processes when there is more than one
+        if len(jobs) > 1:
+            ex = stack.enter_context(ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)))
+            runners = [ex.submit(_process_one_device, **job, **common).result for job in jobs]
+        else:
+            runners = [functools.partial(_process_one_device, **job, **common) for job in jobs]
+
+        # Report each device as soon as it and the ones before it are done,
+        # so one failing device doesn't hide the others' output
+        runners = iter(runners)
+        for entry in pending:
+            if isinstance(entry, str):
+                print(entry)
                 continue
-
-            assets = data.get('assets', {})
-            asset_name = assets.get('resizable') or assets.get('small') or assets.get('medium') or assets.get('large')
-
-            if asset_name and asset_name in files:
-                mapping_size = data['mappingSize']
-                asset_bytes = files[asset_name]
-
-                # Get screen frames for transparency
-                screen_frames = data.get('screens', [])
-                if not screen_frames:
-                    gsf = data.get('gameScreenFrame')
-                    if gsf:
-                        screen_frames = [gsf]
-
-                if asset_name.endswith('.pdf'):
-                    print(f"    Converting {orientation} PDF to PNG...")
-                    try:
-                        img = convert_pdf_to_png(asset_bytes, mapping_size, scale)
-                        if img:
-                            # Make screen area(s) transparent
-                            if screen_frames:
-                                img = make_screen_transparent(img, screen_frames, mapping_size, scale)
-                            img_path = device_output_dir / f'{orientation}.png'
-                            img.save(str(img_path), 'PNG')
-                            print(f"      Saved: {img_path}")
-                    except Exception as e:
-                        print(f"      Error converting PDF: {e}")
-                elif asset_name.endswith('.png'):
-                    # Copy PNG directly
-                    img_path = device_output_dir / f'{orientation}.png'
-                    img_path.write_bytes(asset_bytes)
-                    print(f"      Copied: {img_path}")
-
-        # Generate config
-        config = generate_overlay_config(
-            skin_name, device, orientations, portrait_data, landscape_data
-        )
-        config_path = device_output_dir / f"{dir_name}.cfg"
-        config_path.write_text(config)
-        print(f"    Config: {config_path}")
+            run = next(runners)
+            try:
+                log = run()
+            except Exception as e:
+                print(f"  Error converting {entry['device']}: {e}")
+                continue
+            print('\n'.join(log), flush=True)
 
     print("Done!")
 
@@ -46,3 +46,9 @@ GAME_TYPE_NAMES = {
     'com.rileytestut.delta.game.ds': 'DS',
     'com.rileytestut.delta.game.genesis': 'Genesis',
 }
+
+# DELTA_TO_RETROARCH split by kind, so the common identity-mapped buttons
+# skip the dict lookup entirely
+IDENTITY_INPUTS = frozenset(k for k, v in DELTA_TO_RETROARCH.items() if k == v)
+INPUT_REMAP = {k: v for k, v in DELTA_TO_RETROARCH.items() if k != v and v is not None}
+INPUT_DROP = frozenset(k for k, v in DELTA_TO_RETROARCH.items() if v is None)
@@ -0,0 +1,138 @@
+import io
+import json
+import zipfile
+
+import pytest
+
+import convert
+
+fitz = pytest.importorskip('pymupdf')
+Image = pytest.importorskip('PIL.Image')
+
+
+def _semi_transparent_pdf():
+    doc = fitz.open()
+    page = doc.new_page(width=100, height=80)
+    page.draw_rect(fitz.Rect(10, 10, 90, 70), color=None, fill=(0, 1, 1), fill_opacity=0.5)
+    return doc.tobytes()
+
+
+def test_tiled_render_matches_mupdf_png():
+    """Tiles are un-premultiplied, so semi-transparent pixels match MuPDF's own PNG output."""
+    convert._load_pdf_backend()
+    doc = fitz.open(stream=_semi_transparent_pdf(), filetype='pdf')
+    display_list = doc.load_page(0).get_displaylist()
+
+    img = convert.render_page_tiled(display_list, 300, 240, tile_size=64)
+
+    matrix = fitz.Matrix(3, 3)
+    pix = display_list.get_pixmap(matrix=matrix, alpha=True)
+    expected = Image.open(io.BytesIO(pix.tobytes('png'))).convert('RGBA')
+
+    assert img.mode == 'RGBA'
+    assert img.getpixel((150, 120)) == expected.getpixel((150, 120))
+    assert img.getpixel((150, 120))[3] not in (0, 255)
+    assert img.getpixel((5, 5)) == expected.getpixel((5, 5))
+
+
+def test_corrupt_cache_entry_is_rerendered(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    pdf_bytes = _semi_transparent_pdf()
+    mapping_size = {'width': 100, 'height': 80}
+
+    first = convert.convert_pdf_to_png(pdf_bytes, mapping_size, scale=2)
+    (entry,) = (tmp_path / 'skin2overlay').iterdir()
+    entry.write_bytes(entry.read_bytes()[:100])
+
+    again = convert.convert_pdf_to_png(pdf_bytes, mapping_size, scale=2)
+    assert again.tobytes() == first.tobytes()
+    assert Image.open(entry).size == (200, 160)
+
+
+def test_extended_edge_on_zero_width_item():
+    item = {'inputs': ['a'], 'frame': {'x': 0, 'y': 0, 'width': 0, 'height': 10}, 'extendedEdges': {'top': 5}}
+    desc = convert.convert_item_to_descriptor(item, 100, 100, 0)
+    assert 'overlay0_desc0_reach_up = 2.00\n' in desc
+
+
+def test_descriptor_rounding_matches_division():
+    # Multiplying by 1/320 rounds some sixth decimals differently from the
+    # division that index.html (and the original script) performs
+    for x in range(320):
+        item = {'inputs': ['a'], 'frame': {'x': x, 'y': 7, 'width': 3, 'height': 5}}
+        desc = convert.convert_item_to_descriptor(item, 320, 480, 0)
+        cx = f'{(x + 3 / 2) / 320:.6f}'
+        hw = f'{(3 / 2) / 320:.6f}'
+        assert f',{cx},' in desc and f',{hw},' in desc
+
+
+def test_classify_inputs_ignores_non_string_values():
+    dpad = {'up': 'up', 'down': 'down', 'left': 'left', 'right': 'right', 'extra': ['x']}
+    assert convert.classify_inputs(dpad) == 'dpad'
+    stick = {'up': 'analogStickUp', 'down': 'analogStickDown', 'left': 'analogStickLeft', 'right': 'analogStickRight'}
+    assert convert.classify_inputs(stick) == 'analog'
+
+
+@pytest.mark.parametrize('stream', [False, True])
+def test_info_json_with_bom(tmp_path, monkeypatch, stream):
+    if stream:
+        pytest.importorskip('ijson')
+        monkeypatch.setattr(convert, 'STREAM_INFO_MIN_BYTES', 0)
+    info = {'name': 'Skin', 'representations': {'iphone': {'standard': {}}}}
+    data = b'\xef\xbb\xbf' + json.dumps(info).encode('utf-8')
+    (tmp_path / 'info.json').write_bytes(data)
+    with zipfile.ZipFile(tmp_path / 'skin.deltaskin', 'w') as zf:
+        zf.writestr('info.json', data)
+
+    for path in (tmp_path, tmp_path / 'skin.deltaskin'):
+        assert convert.read_skin_info(path, ['iphone']) == info
+
+
+def test_dir_skin_rejects_names_outside_root(tmp_path):
+    (tmp_path / 'secret.png').write_bytes(b'secret')
+    root = tmp_path / 'skin'
+    root.mkdir()
+    (root / 'a.png').write_bytes(b'asset')
+
+    with convert.open_skin_files(root) as files:
+        assert 'a.png' in files
+        for name in (str(tmp_path / 'secret.png'), '../secret.png'):
+            assert name not in files
+            with pytest.raises(KeyError):
+                files[name]
+            with pytest.raises(KeyError):
+                files.open(name)
+            with pytest.raises(KeyError):
+                files.copy_to(name, tmp_path / 'out.png')
+    assert not (tmp_path / 'out.png').exists()
+
+
+def test_streamed_info_matches_full_parse(tmp_path, monkeypatch):
+    pytest.importorskip('ijson')
+    monkeypatch.setattr(convert, 'STREAM_INFO_MIN_BYTES', 0)
+    device = {
+        'standard': {
+            'portrait': {
+                'assets': {'resizable': 'p.pdf'},
+                'items': [
+                    {'inputs': ['a'], 'frame': {'x': 1.5, 'y': 2, 'width': 3, 'height': 4}},
+                    {'inputs': {'up': 'up', 'down': 'down'}, 'extendedEdges': {'top': 0.25}},
+                ],
+                'mappingSize': {'width': 320, 'height': 480},
+                'translucent': True,
+                'menuInsets': None,
+            },
+        },
+    }
+    info = {
+        'name': 'Skin',
+        'identifier': 'com.example.skin',
+        'gameTypeIdentifier': 'com.rileytestut.delta.game.ds',
+        'debug': False,
+        'representations': {'ipad': {'standard': {}}, 'iphone': device, 'tv': {'standard': {}}},
+    }
+    (tmp_path / 'info.json').write_text(json.dumps(info))
+
+    full = json.loads((tmp_path / 'info.json').read_text())
+    streamed = convert.read_skin_info(tmp_path, ['iphone'])
+    assert streamed == {**full, 'representations': {'iphone': full['representations']['iphone']}}